@@ -2,37 +2,41 @@
 
 Per class diagram: CareerPageFinder with 3-tier strategy.
 Per state machine diagram: Tier1 -> Tier2 -> Tier3 fallback chain.
-Dependencies: requests, beautifulsoup4.
+Dependencies: requests, selectolax, diskcache.
 API Budget: $0 (Tiers 1 & 2 are free).
 """
 
-from typing import List, Optional
-from urllib.parse import urljoin, urlparse
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+import diskcache
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
 
 from claude_fallback import ClaudeFallback
 from config import Configuration
 from logger import Logger
 from models import ExecutionStatistics
-from url_validator import URLValidator
+from url_validator import URLValidator, cached_urljoin, cached_urlparse, has_scheme_and_host
 
 
-class CareerPageFinder:
-    """Discovers career pages using a 3-tier strategy.
-
-    Per class diagram:
-      - Composition: owned by JobSourcePipeline (lifecycle bound)
-      - Dependency: uses Configuration, Logger, URLValidator
-      - Association: fallback to ClaudeFallback (0..1), updates ExecutionStatistics
+class CareerPageFinderBase:
+    """State and helpers shared by the sync and async career page finders.
 
-    Per state machine (Diagram 4):
-      Tier 1 (80%): Direct path testing - FREE
-      Tier 2 (15%): Homepage scraping with BeautifulSoup - FREE
-      Tier 3 (5%):  Claude API fallback - PAID
+    Holds the keyword matching, link parsing, URL helpers and the Tier 1 /
+    result caches; subclasses implement the tiers over their own HTTP
+    client (requests or aiohttp).
     """
 
+    # Tier 1 outcomes shared by every finder for the life of the process, so
+    # domains that recur within a run (e.g. via subsidiaries) are probed once.
+    _positive_cache: Dict[str, str] = {}          # domain -> career page URL
+    _negative_cache: Set[Tuple[str, str]] = set()  # (domain, path) that returned 404
+
     def __init__(
         self,
         config: Configuration,
@@ -40,8 +44,8 @@ class CareerPageFinder:
         statistics: ExecutionStatistics,
         claude_fallback: Optional[ClaudeFallback] = None,
     ) -> None:
-        self.common_paths: List[str] = list(config.career_paths)
-        self.career_keywords: List[str] = list(config.career_keywords)
+        self.common_paths: Tuple[str, ...] = config.career_paths
+        self.career_keywords: FrozenSet[str] = config.career_keywords
         self.request_timeout: int = config.request_timeout
         self.max_retries: int = 2
         self.tier1_success_count: int = 0
@@ -50,8 +54,159 @@ class CareerPageFinder:
         self._logger = logger
         self._statistics = statistics
         self._claude_fallback = claude_fallback
-        self._validator = URLValidator(timeout=config.request_timeout)
+        self._validator = URLValidator(
+            timeout=config.request_timeout,
+            cache_dir=config.cache_dir,
+            ttl_seconds=config.url_cache_ttl,
+        )
         self._headers = {"User-Agent": self._validator.user_agent}
+        self._kw_re = self._build_keyword_pattern(self.career_keywords)
+        self._origin_cache: Dict[str, str] = {}  # base_url -> scheme://netloc
+        # Persistent (url, tier) per domain so repeat runs skip all three tiers
+        self.cache_ttl: int = config.cache_ttl
+        self._result_cache = diskcache.Cache(os.path.join(config.cache_dir, "careers"))
+
+    def _unprobed_paths(self, domain: str) -> List[str]:
+        """Candidate paths not already known to be dead for this domain."""
+        return [path for path in self.common_paths if (domain, path) not in self._negative_cache]
+
+    def _mark_dead_path(self, company_url: str, path: str) -> None:
+        """Remember a path that returned a definitive 404 so it is not re-probed."""
+        self._negative_cache.add((cached_urlparse(company_url).netloc, path))
+
+    def _find_link_in_html(self, company_url: str, html: bytes) -> Optional[str]:
+        """Parse homepage HTML and return the first career link found.
+
+        Takes the raw response bytes: the parser detects the encoding itself,
+        so callers never touch response.text (and its charset sniffing).
+        Parsing and CSS selection run in selectolax's C parser (lexbor).
+        """
+        tree = LexborHTMLParser(html)
+
+        # Check footer/nav first (common location for career links)
+        footer_result = self.check_footer_nav(tree)
+        if footer_result:
+            return self.make_absolute_url(company_url, footer_result)
+
+        # Scan all links for career keywords (FR-2.3)
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href") or ""
+            if self._link_matches(link, href):
+                absolute_url = self.make_absolute_url(company_url, href)
+                if self.validate_url(absolute_url):
+                    return absolute_url
+        return None
+
+    def check_footer_nav(self, tree: LexborHTMLParser) -> Optional[str]:
+        """Check footer and nav elements for career links."""
+        for link in tree.css("footer a[href], nav a[href]"):
+            href = link.attributes.get("href") or ""
+            if self._link_matches(link, href):
+                return href
+        return None
+
+    def make_absolute_url(self, base_url: str, relative_url: str) -> str:
+        """FR-2.5: Return absolute URLs only.
+
+        Fast paths for already-absolute and root-relative hrefs; everything
+        else (../, ?query, #fragment, //host) goes through urljoin.
+        """
+        if relative_url.startswith(("http://", "https://")):
+            return relative_url
+        if relative_url.startswith("/") and not relative_url.startswith("//"):
+            origin = self._origin_cache.get(base_url)
+            if origin is None:
+                parsed = cached_urlparse(base_url)
+                origin = f"{parsed.scheme}://{parsed.netloc}"
+                self._origin_cache[base_url] = origin
+            return origin + relative_url
+        return cached_urljoin(base_url, relative_url)
+
+    def validate_url(self, url: str) -> bool:
+        """Quick structural validation (no HTTP check)."""
+        return has_scheme_and_host(url)
+
+    def _get_cached_result(self, company_url: str) -> Optional[Tuple[str, int]]:
+        """Return a previously discovered (career_url, tier) for this domain, if any."""
+        domain = cached_urlparse(company_url).netloc
+        entry = self._result_cache.get(domain)
+        if entry is None:
+            return None
+        url, tier = entry
+        self._statistics.increment_success(tier=tier)
+        self._logger.info(f"Cache hit (tier {tier}): {url}")
+        return url, tier
+
+    def _record_success(self, company_url: str, result: str, tier: int) -> str:
+        """Count a tier success and persist it for later runs."""
+        if tier == 1:
+            self.tier1_success_count += 1
+        elif tier == 2:
+            self.tier2_success_count += 1
+        elif tier == 3:
+            self.tier3_success_count += 1
+        self._statistics.increment_success(tier=tier)
+        self._logger.info(f"Tier {tier} success: {result}")
+        domain = cached_urlparse(company_url).netloc
+        self._result_cache.set(domain, (result, tier), expire=self.cache_ttl)
+        return result
+
+    def _build_keyword_pattern(self, keywords: Iterable[str]) -> "re.Pattern[str]":
+        """Compile career keywords into one case-insensitive alternation."""
+        return re.compile(
+            "|".join(re.escape(keyword) for keyword in sorted(keywords)), re.IGNORECASE
+        )
+
+    def _url_matches(self, url: str) -> bool:
+        """True if any career keyword occurs in the URL."""
+        return self._kw_re.search(url) is not None
+
+    def _text_matches(self, text: str) -> bool:
+        """True if any career keyword occurs in the link text."""
+        return self._kw_re.search(text) is not None
+
+    def _link_matches(self, link: LexborNode, href: str) -> bool:
+        """FR-2.3: Match career keywords in link URL or text.
+
+        The href is checked first; text() walks the anchor's children,
+        so it is only materialized when the URL does not match.
+        """
+        if self._url_matches(href):
+            return True
+        return self._text_matches(link.text(strip=True))
+
+    def _is_valid_career_page(self, url: str, content: str) -> bool:
+        """Verify URL looks like a career page (not a generic redirect)."""
+        return self._url_matches(url)
+
+
+class CareerPageFinder(CareerPageFinderBase):
+    """Discovers career pages using a 3-tier strategy.
+
+    Per class diagram:
+      - Composition: owned by JobSourcePipeline (lifecycle bound)
+      - Dependency: uses Configuration, Logger, URLValidator
+      - Association: fallback to ClaudeFallback (0..1), updates ExecutionStatistics
+
+    Per state machine (Diagram 4):
+      Tier 1 (80%): Direct path testing - FREE
+      Tier 2 (15%): Homepage scraping with selectolax - FREE
+      Tier 3 (5%):  Claude API fallback - PAID
+
+    Blocking HTTP: Tier 1 probes run on a thread pool over one pooled
+    requests.Session.
+    """
+
+    def __init__(
+        self,
+        config: Configuration,
+        logger: Logger,
+        statistics: ExecutionStatistics,
+        claude_fallback: Optional[ClaudeFallback] = None,
+    ) -> None:
+        super().__init__(config, logger, statistics, claude_fallback)
+        self.probe_workers: int = config.probe_workers
+        self._session = self._build_session(config.http_pool_size)
 
     def find_career_page(self, company_url: str) -> Optional[str]:
         """Main entry: try Tier 1 -> Tier 2 -> Tier 3. Per sequence diagram.
@@ -61,30 +216,25 @@ class CareerPageFinder:
         company_url = self._validator.normalize(company_url)
         self._logger.info(f"Finding career page for {company_url}")
 
+        cached = self._get_cached_result(company_url)
+        if cached:
+            return cached[0]
+
         # Tier 1: Direct paths (80% expected success)
         result = self.find_via_direct_paths(company_url)
         if result:
-            self.tier1_success_count += 1
-            self._statistics.increment_success(tier=1)
-            self._logger.info(f"Tier 1 success: {result}")
-            return result
+            return self._record_success(company_url, result, tier=1)
 
         # Tier 2: Homepage scraping (15% expected success)
         result = self.scrape_homepage(company_url)
         if result:
-            self.tier2_success_count += 1
-            self._statistics.increment_success(tier=2)
-            self._logger.info(f"Tier 2 success: {result}")
-            return result
+            return self._record_success(company_url, result, tier=2)
 
         # Tier 3: Claude API fallback (5% expected success)
         if self._claude_fallback:
             result = self._claude_fallback.find_career_page_ai(company_url)
             if result:
-                self.tier3_success_count += 1
-                self._statistics.increment_success(tier=3)
-                self._logger.info(f"Tier 3 success: {result}")
-                return result
+                return self._record_success(company_url, result, tier=3)
 
         self._logger.warning(f"No career page found for {company_url}")
         return None
@@ -94,21 +244,45 @@ class CareerPageFinder:
 
         Per state machine: Testing -> Success (80%) or Failed (all paths exhausted).
         """
-        for path in self.common_paths:
-            test_url = company_url.rstrip("/") + path
-            try:
-                response = requests.head(
-                    test_url,
-                    timeout=self.request_timeout,
-                    headers=self._headers,
-                    allow_redirects=True,
-                )
-                if response.status_code == 200:
-                    # Verify it's actually a career page, not a generic redirect
-                    if self._is_valid_career_page(response.url, ""):
-                        return response.url
-            except requests.RequestException:
-                continue
+        domain = cached_urlparse(company_url).netloc
+        known = self._positive_cache.get(domain)
+        if known:
+            return known
+
+        executor = ThreadPoolExecutor(max_workers=self.probe_workers)
+        try:
+            futures = {
+                executor.submit(self._probe, company_url, path): path
+                for path in self._unprobed_paths(domain)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    self._positive_cache[domain] = result
+                    return result
+            return None
+        finally:
+            # Cancel probes still queued once a career page is found
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _probe(self, company_url: str, path: str) -> Optional[str]:
+        """HEAD a single candidate path over the shared session."""
+        test_url = company_url.rstrip("/") + path
+        try:
+            response = self._session.head(
+                test_url,
+                timeout=self.request_timeout,
+                allow_redirects=True,
+            )
+            if response.status_code == 200:
+                # Verify it's actually a career page, not a generic redirect
+                if self._is_valid_career_page(response.url, ""):
+                    return response.url
+            elif response.status_code == 404:
+                self._mark_dead_path(company_url, path)
+        except requests.RequestException:
+            # Timeouts/connection errors may be transient: probe again next time
+            pass
         return None
 
     def scrape_homepage(self, company_url: str) -> Optional[str]:
@@ -117,65 +291,30 @@ class CareerPageFinder:
         Per state machine: Scraping -> ExtractingLinks -> MatchingKeywords.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 company_url,
                 timeout=self.request_timeout,
-                headers=self._headers,
                 allow_redirects=True,
             )
             if response.status_code != 200:
                 return None
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Check footer/nav first (common location for career links)
-            footer_result = self.check_footer_nav(soup)
-            if footer_result:
-                return self.make_absolute_url(company_url, footer_result)
-
-            # Scan all links for career keywords (FR-2.3)
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-                text = link.get_text(strip=True).lower()
-                if self._matches_career_keyword(text, href):
-                    absolute_url = self.make_absolute_url(company_url, href)
-                    if self.validate_url(absolute_url):
-                        return absolute_url
+            return self._find_link_in_html(company_url, response.content)
 
         except requests.RequestException as e:
             self._logger.error(f"Homepage scrape failed for {company_url}", e)
 
         return None
 
-    def check_footer_nav(self, soup: BeautifulSoup) -> Optional[str]:
-        """Check footer and nav elements for career links."""
-        for container_tag in ["footer", "nav"]:
-            for container in soup.find_all(container_tag):
-                for link in container.find_all("a", href=True):
-                    href = link.get("href", "")
-                    text = link.get_text(strip=True).lower()
-                    if self._matches_career_keyword(text, href):
-                        return href
-        return None
-
-    def make_absolute_url(self, base_url: str, relative_url: str) -> str:
-        """FR-2.5: Return absolute URLs only."""
-        return urljoin(base_url, relative_url)
-
-    def validate_url(self, url: str) -> bool:
-        """Quick structural validation (no HTTP check)."""
-        try:
-            parsed = urlparse(url)
-            return all([parsed.scheme, parsed.netloc])
-        except Exception:
-            return False
-
-    def _matches_career_keyword(self, text: str, url: str) -> bool:
-        """FR-2.3: Match against career keywords in link text or URL."""
-        combined = (text + " " + url).lower()
-        return any(keyword in combined for keyword in self.career_keywords)
-
-    def _is_valid_career_page(self, url: str, content: str) -> bool:
-        """Verify URL looks like a career page (not a generic redirect)."""
-        url_lower = url.lower()
-        return any(keyword in url_lower for keyword in self.career_keywords)
+    def _build_session(self, pool_size: int) -> requests.Session:
+        """Shared keep-alive session so probes reuse pooled connections (and TLS)."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=1, backoff_factor=0.1),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
@@ -0,0 +1,205 @@
+"""Asynchronous career page discovery (SRS Section 6.2).
+
+Per class diagram: CareerPageFinder's 3-tier strategy over asyncio/aiohttp;
+shares matching, parsing and caches with it via CareerPageFinderBase.
+Tiers 1 & 2 run on a single asyncio event loop so all companies in a run
+share one connection pool instead of blocking on each HTTP request in turn.
+Dependencies: aiohttp, selectolax.
+API Budget: $0 (Tiers 1 & 2 are free).
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+import aiohttp
+
+from career_finder import CareerPageFinderBase
+from claude_fallback import ClaudeFallback
+from config import Configuration
+from logger import Logger
+from models import ExecutionStatistics
+from url_validator import cached_urlparse
+
+
+class AsyncCareerPageFinder(CareerPageFinderBase):
+    """Discovers career pages for many companies concurrently.
+
+    Per class diagram:
+      - Same 3-tier strategy as CareerPageFinder; shares CareerPageFinderBase
+        with it (keyword matching, link parsing, caches)
+      - Composition: owned by JobSourcePipeline (lifecycle bound)
+
+    Connection limits:
+      - connection_limit: total in-flight sockets across all companies
+      - limit_per_host: caps concurrent probes against a single domain
+    """
+
+    def __init__(
+        self,
+        config: Configuration,
+        logger: Logger,
+        statistics: ExecutionStatistics,
+        claude_fallback: Optional[ClaudeFallback] = None,
+    ) -> None:
+        super().__init__(config, logger, statistics, claude_fallback)
+        self.connection_limit: int = 100
+        self.limit_per_host: int = 4
+        self.dns_cache_ttl: int = 300
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        # Per-socket timeouts only: a total timeout would also count time spent
+        # queued for a connection slot (limit / limit_per_host) and fail live
+        # pages that were simply waiting their turn
+        self._request_timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.request_timeout,
+            sock_read=self.request_timeout,
+        )
+
+    async def find_career_pages(
+        self, company_urls: List[str]
+    ) -> List[Tuple[Optional[str], int]]:
+        """Run 3-tier discovery for every company over one shared session.
+
+        Tiers 1 & 2 run concurrently per company; companies they miss are sent
+        to Claude together in one batched Tier 3 call.
+        Returns (career_url, tier) per company in the same order as
+        company_urls; (None, 0) on failure.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        async with aiohttp.ClientSession(connector=connector, headers=self._headers) as session:
+            self._aio_session = session
+            try:
+                results = await asyncio.gather(
+                    *(self._find_via_free_tiers(url) for url in company_urls),
+                    return_exceptions=True,
+                )
+            finally:
+                self._aio_session = None
+
+        discovered: List[Tuple[Optional[str], int]] = []
+        for company_url, result in zip(company_urls, results):
+            if isinstance(result, Exception):
+                self._logger.error(f"Career page discovery failed for {company_url}", result)
+                discovered.append((None, 0))
+            else:
+                discovered.append(result)
+
+        # Tier 3: one batched Claude call for everything Tiers 1 & 2 missed
+        misses = {
+            i: self._validator.normalize(url)
+            for i, url in enumerate(company_urls)
+            if discovered[i][0] is None
+        }
+        if misses and self._claude_fallback:
+            ai_results = self._claude_fallback.find_career_pages_ai(list(misses.values()))
+            for i, normalized in misses.items():
+                result = ai_results.get(normalized)
+                if result:
+                    discovered[i] = (self._record_success(normalized, result, tier=3), 3)
+
+        for company_url, (career_url, _) in zip(company_urls, discovered):
+            if career_url is None:
+                self._logger.warning(f"No career page found for {company_url}")
+        return discovered
+
+    async def _find_via_free_tiers(self, company_url: str) -> Tuple[Optional[str], int]:
+        """Cache -> Tier 1 -> Tier 2 for one company (no paid calls).
+
+        Returns (career_url, tier), or (None, 0) if neither tier succeeded.
+        """
+        company_url = self._validator.normalize(company_url)
+        self._logger.info(f"Finding career page for {company_url}")
+
+        cached = self._get_cached_result(company_url)
+        if cached:
+            return cached
+
+        result = await self.find_via_direct_paths(company_url)
+        if result:
+            return self._record_success(company_url, result, tier=1), 1
+
+        result = await self.scrape_homepage(company_url)
+        if result:
+            return self._record_success(company_url, result, tier=2), 2
+
+        return None, 0
+
+    async def find_career_page(self, company_url: str) -> Optional[str]:
+        """Main entry: try Tier 1 -> Tier 2 -> Tier 3. Per sequence diagram.
+
+        Single-company convenience over find_career_pages (opens its own session).
+        FR-2.5: Returns absolute URL only, or None.
+        """
+        return (await self.find_career_pages([company_url]))[0][0]
+
+    async def find_via_direct_paths(self, company_url: str) -> Optional[str]:
+        """Tier 1 (FR-2.1): Test common career page paths concurrently.
+
+        Per state machine: Testing -> Success (80%) or Failed (all paths exhausted).
+        """
+        domain = cached_urlparse(company_url).netloc
+        known = self._positive_cache.get(domain)
+        if known:
+            return known
+
+        tasks = [
+            asyncio.ensure_future(self._probe(company_url, path))
+            for path in self._unprobed_paths(domain)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result:
+                    self._positive_cache[domain] = result
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _probe(self, company_url: str, path: str) -> Optional[str]:
+        """HEAD a single candidate path over the shared event-loop session."""
+        test_url = company_url.rstrip("/") + path
+        try:
+            async with self._aio_session.head(
+                test_url,
+                allow_redirects=True,
+                timeout=self._request_timeout,
+            ) as response:
+                if response.status == 200:
+                    final_url = str(response.url)
+                    # Verify it's actually a career page, not a generic redirect
+                    if self._is_valid_career_page(final_url, ""):
+                        return final_url
+                elif response.status == 404:
+                    self._mark_dead_path(company_url, path)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Timeouts/connection errors may be transient: probe again next time
+            pass
+        return None
+
+    async def scrape_homepage(self, company_url: str) -> Optional[str]:
+        """Tier 2 (FR-2.2): Scrape homepage for career links.
+
+        Per state machine: Scraping -> ExtractingLinks -> MatchingKeywords.
+        """
+        try:
+            async with self._aio_session.get(
+                company_url,
+                allow_redirects=True,
+                timeout=self._request_timeout,
+            ) as response:
+                if response.status != 200:
+                    return None
+                html = await response.read()
+
+            return self._find_link_in_html(company_url, html)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.error(f"Homepage scrape failed for {company_url}", e)
+
+        return None
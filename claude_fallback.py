@@ -6,14 +6,17 @@ Dependencies: anthropic.
 API Budget: $15-20/month, max 50 calls/month (NFR-2.2).
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import anthropic
+import orjson
 
 from config import Configuration
 from logger import Logger
 from models import ExecutionStatistics
 
+if TYPE_CHECKING:
+    import anthropic
+
 
 class ClaudeFallback:
     """AI-powered career page discovery as last resort.
@@ -42,7 +45,7 @@ class ClaudeFallback:
         self.monthly_budget: float = 20.0
         self._logger = logger
         self._statistics = statistics
-        self._client: Optional[anthropic.Anthropic] = None
+        self._client: Optional["anthropic.Anthropic"] = None
 
     def find_career_page_ai(self, company_url: str) -> Optional[str]:
         """Tier 3: Use Claude to find career page URL.
@@ -60,11 +63,8 @@ class ClaudeFallback:
         self._logger.info(f"Tier 3: Using Claude API for {company_url}")
 
         try:
-            if self._client is None:
-                self._client = anthropic.Anthropic(api_key=self.api_key)
-
             prompt = self._build_prompt(company_url)
-            response = self._client.messages.create(
+            response = self._get_client().messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 messages=[{"role": "user", "content": prompt}],
@@ -76,6 +76,56 @@ class ClaudeFallback:
             self._logger.error(f"Claude API call failed for {company_url}", e)
             return None
 
+    def find_career_pages_ai(self, company_urls: List[str]) -> Dict[str, Optional[str]]:
+        """Tier 3 (batched): resolve several companies in a single Claude call.
+
+        Counts as one call against the monthly limit (NFR-2.2).
+        Returns company_url -> career page URL (None where unknown).
+        """
+        results: Dict[str, Optional[str]] = {url: None for url in company_urls}
+        if not company_urls:
+            return results
+
+        if not self.check_monthly_limit():
+            self._logger.warning("Claude API monthly limit reached, skipping")
+            return results
+
+        if not self.api_key:
+            self._logger.warning("No Anthropic API key configured, skipping Claude fallback")
+            return results
+
+        self._logger.info(f"Tier 3: Using Claude API for {len(company_urls)} companies")
+
+        try:
+            prompt = self._build_batch_prompt(company_urls)
+            response = self._get_client().messages.create(
+                model=self.model,
+                max_tokens=max(self.max_tokens, 64 * len(company_urls)),
+                messages=[
+                    {"role": "user", "content": prompt},
+                    # Prefill the opening brace so the reply is a bare JSON object
+                    {"role": "assistant", "content": "{"},
+                ],
+            )
+            self.increment_call_counter()
+            results.update(self._parse_batch_response(response, company_urls))
+            return results
+
+        except Exception as e:
+            self._logger.error(f"Claude API batch call failed for {len(company_urls)} companies", e)
+            return results
+
+    def _get_client(self) -> "anthropic.Anthropic":
+        """Create the Anthropic client on first use.
+
+        The SDK is imported lazily so runs that never reach Tier 3 skip its import cost.
+        """
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
+
     def check_monthly_limit(self) -> bool:
         """Per state machine: CheckingLimit -> CallingAPI or Failed."""
         return self.calls_this_month < self.max_calls_per_month
@@ -93,6 +143,32 @@ class ClaudeFallback:
             f"If you don't know, return 'UNKNOWN'."
         )
 
+    def _build_batch_prompt(self, company_urls: List[str]) -> str:
+        """Construct a single prompt covering several companies."""
+        return (
+            "For each company URL below, find its careers/jobs page URL. "
+            "Return ONLY a JSON object mapping each input URL to the full careers URL, "
+            "or null if you don't know.\n"
+            f"URLs: {orjson.dumps(company_urls).decode()}"
+        )
+
+    def _parse_batch_response(
+        self, response: object, company_urls: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """Extract {company_url: careers_url} pairs from a batched response."""
+        try:
+            mapping = orjson.loads("{" + response.content[0].text)
+        except (AttributeError, IndexError, ValueError):
+            return {}
+        if not isinstance(mapping, dict):
+            return {}
+        parsed: Dict[str, Optional[str]] = {}
+        for url in company_urls:
+            value = mapping.get(url)
+            if isinstance(value, str) and value.startswith("http"):
+                parsed[url] = value.strip()
+        return parsed
+
     def _parse_claude_response(self, response: object) -> Optional[str]:
         """Extract URL from Claude response."""
         try:
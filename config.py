@@ -1,7 +1,38 @@
 """Configuration module for AI Job Source Agent (SRS Section 7)."""
 
 import os
-from typing import Any, List
+from typing import Any, FrozenSet, Tuple
+
+# Career page patterns (SRS Section 7, FR-2.1, FR-2.3).
+# Constant for the program's lifetime, so built once at import and shared.
+CAREER_PATHS: Tuple[str, ...] = (
+    "/careers",
+    "/jobs",
+    "/about/careers",
+    "/about/jobs",
+    "/join-us",
+    "/work-with-us",
+    "/career",
+    "/job-openings",
+    "/open-positions",
+    "/opportunities",
+    "/en/careers",
+    "/us/careers",
+    "/company/careers",
+)
+CAREER_KEYWORDS: FrozenSet[str] = frozenset({
+    "careers",
+    "jobs",
+    "join us",
+    "opportunities",
+    "work with us",
+    "open positions",
+    "job openings",
+    "we're hiring",
+    "hiring",
+    "come work",
+    "employment",
+})
 
 
 class Configuration:
@@ -18,49 +49,37 @@ class Configuration:
         self.anthropic_api_key: str = ""
 
         # Career page patterns (SRS Section 7, FR-2.1, FR-2.3)
-        self.career_paths: List[str] = [
-            "/careers",
-            "/jobs",
-            "/about/careers",
-            "/about/jobs",
-            "/join-us",
-            "/work-with-us",
-            "/career",
-            "/job-openings",
-            "/open-positions",
-            "/opportunities",
-            "/en/careers",
-            "/us/careers",
-            "/company/careers",
-        ]
-        self.career_keywords: List[str] = [
-            "careers",
-            "jobs",
-            "join us",
-            "opportunities",
-            "work with us",
-            "open positions",
-            "job openings",
-            "we're hiring",
-            "hiring",
-            "come work",
-            "employment",
-        ]
+        self.career_paths: Tuple[str, ...] = CAREER_PATHS
+        self.career_keywords: FrozenSet[str] = CAREER_KEYWORDS
 
         # Limits (SRS Section 7, NFR-2.2)
         self.max_claude_calls: int = 50
         self.request_timeout: int = 5       # NFR-1.3: 5s per HTTP request
         self.browser_timeout: int = 15000   # FR-3.4: 15s per page
+        # Disables Chromium's sandbox; only for root-in-container setups
+        self.browser_no_sandbox: bool = False
+
+        # Concurrency
+        self.probe_workers: int = 16        # Parallel Tier 1 path probes
+        self.http_pool_size: int = 32       # Pooled keep-alive connections
+        self.max_workers: int = 4           # Companies processed in parallel (one browser each)
 
         # Output (SRS Section 7)
         self.output_dir: str = "./output"
 
+        # Persistent caches (career pages, URL status checks, positions)
+        self.cache_dir: str = "./.cache"
+        self.cache_ttl: int = 7 * 24 * 3600       # 7 days, in seconds
+        self.url_cache_ttl: int = 24 * 3600       # 24h, in seconds
+        self.position_cache_ttl: int = 24 * 3600  # 24h, in seconds
+
         self.load_from_env()
 
     def load_from_env(self) -> None:
         """Load API keys from environment variables (NFR-4.2)."""
         self.apify_token = os.environ.get("APIFY_TOKEN", "")
         self.anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+        self.browser_no_sandbox = os.environ.get("BROWSER_NO_SANDBOX", "") == "1"
 
     def validate(self) -> bool:
         """Validate that required configuration is present."""
@@ -6,9 +6,8 @@ Dependencies: apify-client or requests.
 API Budget: $20-25/month.
 """
 
-from typing import Dict, List, Optional
-
-from apify_client import ApifyClient
+from itertools import chain, islice
+from typing import Dict, Generator, Iterable, Iterator, Optional
 
 from config import Configuration
 from logger import Logger
@@ -42,45 +41,54 @@ class LinkedInFetcher:
 
     def fetch_job_listings(
         self, linkedin_url: str, limit: int = 50
-    ) -> List[Dict]:
+    ) -> Generator[Dict, None, None]:
         """FR-1.1: Fetch job listings from LinkedIn via third-party API.
 
+        Items are streamed from the Apify dataset as they are consumed
+        rather than loaded into memory up front. The API call is made on
+        first iteration; close() the generator when stopping early so the
+        API cost is logged right away (NFR-2.1).
+
         Args:
             linkedin_url: LinkedIn job search URL.
             limit: Max items to fetch (FR-1.3: 20-50).
 
-        Returns:
-            Raw API response items.
+        Yields:
+            Raw API response items (none on failure).
         """
         self._logger.info(f"Fetching up to {limit} listings from LinkedIn")
         try:
-            raw = self._make_api_request(linkedin_url, {"maxItems": min(limit, self.max_items)})
-            if not self.validate_api_response(raw):
+            items = self._make_api_request(linkedin_url, {"maxItems": min(limit, self.max_items)})
+            first = next(items, None)
+            if not self.validate_api_response(first):
                 self._logger.error("Invalid API response from LinkedIn fetcher")
-                return []
-            self._track_api_cost(len(raw))
+                return
             self._statistics.linkedin_api_calls += 1
-            return raw
         except Exception as e:
             self._logger.error("LinkedIn API failure", e)
-            return []
+            return
+        # close() on this generator also closes _stream_items, logging the cost
+        yield from self._stream_items(chain([first], items))
 
-    def extract_company_data(self, raw_response: List[Dict]) -> List[CompanyData]:
+    def extract_company_data(self, raw_response: Iterable[Dict]) -> Iterator[CompanyData]:
         """FR-1.2: Extract company name, company website URL.
 
         Per class diagram: produces CompanyData with multiplicity 1..*.
+        Yields each company as soon as its raw item arrives.
         """
-        companies: List[CompanyData] = []
+        warn = self._logger.warning
         for item in raw_response:
-            company_name = item.get("companyName", "") or item.get("company", "")
-            company_url = item.get("companyWebsite", "") or item.get("companyUrl", "") or item.get("companyLink", "")
-            linkedin_job_url = item.get("link", "") or item.get("jobUrl", "")
-            job_title = item.get("title", "") or item.get("jobTitle", "")
+            get = item.get  # local binding: avoids repeated attribute lookups
+            company_name = get("companyName") or get("company") or ""
+            company_url = get("companyWebsite") or get("companyUrl") or get("companyLink") or ""
 
             if not company_name or not company_url:
-                self._logger.warning(f"Skipping item with missing data: {item.get('title', 'unknown')}")
+                warn(f"Skipping item with missing data: {get('title', 'unknown')}")
                 continue
 
+            linkedin_job_url = get("link") or get("jobUrl") or ""
+            job_title = get("title") or get("jobTitle") or ""
+
             company = CompanyData(
                 company_name=company_name,
                 company_url=company_url,
@@ -89,12 +97,9 @@ class LinkedInFetcher:
             )
 
             if company.validate_url():
-                companies.append(company)
+                yield company
             else:
-                self._logger.warning(f"Invalid URL for {company_name}: {company_url}")
-
-        self._logger.info(f"Extracted {len(companies)} companies from API response")
-        return companies
+                warn(f"Invalid URL for {company_name}: {company_url}")
 
     def handle_rate_limit(self, response: Dict) -> bool:
         """FR-1.4: Handle API rate limits gracefully."""
@@ -104,25 +109,45 @@ class LinkedInFetcher:
         return False
 
     def validate_api_response(self, response: object) -> bool:
-        """Validate the API returned usable data."""
+        """Validate the API returned usable data (a list, or its first item)."""
         if response is None:
             return False
+        if isinstance(response, dict):
+            return True
         if isinstance(response, list):
             return len(response) > 0
         return False
 
-    def _make_api_request(self, linkedin_url: str, params: Dict) -> List[Dict]:
-        """Call Apify actor to scrape LinkedIn job listings."""
+    def _make_api_request(self, linkedin_url: str, params: Dict) -> Iterator[Dict]:
+        """Call Apify actor to scrape LinkedIn job listings.
+
+        The actor run completes here; dataset items are paged in lazily.
+        """
+        from apify_client import ApifyClient  # lazy: only needed when fetching
+
         client = ApifyClient(self.api_token)
         run_input = {
             "urls": [linkedin_url],
             "maxItems": params.get("maxItems", self.max_items),
         }
         run = client.actor("hKByXkMQaC5Qt9UMN").call(run_input=run_input)
-        items = list(client.dataset(run["defaultDatasetId"]).iterate_items())
+        max_items = run_input["maxItems"]
+        items = islice(client.dataset(run["defaultDatasetId"]).iterate_items(), max_items)
         self.api_calls_made += 1
         return items
 
+    def _stream_items(self, items: Iterator[Dict]) -> Iterator[Dict]:
+        """Yield dataset items, tracking cost once the stream is finished."""
+        fetched = 0
+        try:
+            for item in items:
+                fetched += 1
+                yield item
+        except Exception as e:
+            self._logger.error("LinkedIn API failure while streaming results", e)
+        finally:
+            self._track_api_cost(fetched)
+
     def _track_api_cost(self, items_fetched: int) -> None:
         """Track estimated API cost against budget (NFR-2.1)."""
         estimated_cost = items_fetched * 0.01  # rough per-item estimate
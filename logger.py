@@ -4,49 +4,93 @@ Per class diagram: depended on by all components via dependency relationship.
 Per SRS NFR-3.1: Log all errors with timestamps.
 """
 
-import json
+import atexit
+import logging
 import os
+import queue
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+import orjson
 
 
 class Logger:
     """Centralized logger with file persistence.
 
-    Per class diagram: log_file, log_level, logs attributes.
+    Per class diagram: log_file, log_level attributes.
     Singleton pattern: shared instance across all components.
+
+    Callers only enqueue records; a background QueueListener thread does the
+    console and file I/O, so logging never blocks concurrent workers.
     """
 
     def __init__(self, log_file: str = "pipeline.log", log_level: str = "INFO") -> None:
         self.log_file: str = log_file
         self.log_level: str = log_level
-        self.logs: List[Dict] = []
+        os.makedirs(os.path.dirname(self.log_file) if os.path.dirname(self.log_file) else ".", exist_ok=True)
+
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self._logger = logging.getLogger(f"ai_job_source_agent.{log_file}")
+        self._logger.setLevel(log_level)
+        self._logger.propagate = False
+        self._logger.handlers = [QueueHandler(self._queue)]
+
+        # delay: the previous run's log is only truncated once there is something to write
+        file_handler = logging.FileHandler(self.log_file, mode="w", delay=True)
+        file_handler.setFormatter(_JsonLineFormatter())
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_ConsoleFormatter())
+        self._listener = QueueListener(self._queue, file_handler, console_handler)
+        self._listener.start()
+        self._running = True
+        # The listener thread is a daemon: drain the queue even when a caller
+        # returns early without calling save_logs()
+        atexit.register(self.save_logs)
 
     def info(self, message: str) -> None:
-        self._log("INFO", message)
+        self._log(logging.INFO, message)
 
     def error(self, message: str, exception: Optional[Exception] = None) -> None:
         entry_message = message
         if exception:
             entry_message = f"{message} | {type(exception).__name__}: {exception}"
-        self._log("ERROR", entry_message)
+        self._log(logging.ERROR, entry_message)
 
     def warning(self, message: str) -> None:
-        self._log("WARNING", message)
+        self._log(logging.WARNING, message)
 
     def save_logs(self) -> None:
-        """Persist logs to file."""
-        os.makedirs(os.path.dirname(self.log_file) if os.path.dirname(self.log_file) else ".", exist_ok=True)
-        with open(self.log_file, "w") as f:
-            json.dump(self.logs, f, indent=2, default=str)
-
-    def _log(self, level: str, message: str) -> None:
-        """NFR-3.1: All entries include timestamp."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "level": level,
-            "message": message,
-        }
-        self.logs.append(entry)
-        # Also print to console for immediate feedback
-        print(f"[{entry['timestamp']}] {level}: {message}")
+        """Flush pending entries to file and stop the background writer."""
+        if self._running:
+            self._listener.stop()
+            self._running = False
+            for handler in self._listener.handlers:
+                handler.close()
+
+    def _log(self, level: int, message: str) -> None:
+        """NFR-3.1: All entries include timestamp (added by the formatters)."""
+        self._logger.log(level, message)
+
+
+def _record_timestamp(record: logging.LogRecord) -> str:
+    return datetime.fromtimestamp(record.created).isoformat()
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps({
+            "timestamp": _record_timestamp(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }).decode()
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Console feedback in the form [timestamp] LEVEL: message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"[{_record_timestamp(record)}] {record.levelname}: {record.getMessage()}"
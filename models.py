@@ -3,10 +3,12 @@
 Per class diagram: CompanyData, JobSourceResult, ExecutionStatistics.
 """
 
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional
-from urllib.parse import urlparse
+
+from url_validator import has_scheme_and_host
 
 
 @dataclass
@@ -31,11 +33,7 @@ class CompanyData:
         }
 
     def validate_url(self) -> bool:
-        try:
-            result = urlparse(self.company_url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return has_scheme_and_host(self.company_url)
 
 
 @dataclass
@@ -80,6 +78,7 @@ class ExecutionStatistics:
 
     Per class diagram: owned by Pipeline and OutputManager.
     Per SRS FR-4.2: success rate, API calls used.
+    Counter updates are guarded by a lock so concurrent workers can share it.
     """
 
     total_processed: int = 0
@@ -93,20 +92,25 @@ class ExecutionStatistics:
     total_processing_time: float = 0.0
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def increment_success(self, tier: int) -> None:
-        self.successful += 1
-        self.total_processed += 1
-        if tier == 1:
-            self.tier1_success += 1
-        elif tier == 2:
-            self.tier2_success += 1
-        elif tier == 3:
-            self.tier3_success += 1
+        with self._lock:
+            self.successful += 1
+            self.total_processed += 1
+            if tier == 1:
+                self.tier1_success += 1
+            elif tier == 2:
+                self.tier2_success += 1
+            elif tier == 3:
+                self.tier3_success += 1
 
     def increment_failure(self) -> None:
-        self.failed += 1
-        self.total_processed += 1
+        with self._lock:
+            self.failed += 1
+            self.total_processed += 1
 
     def calculate_success_rate(self) -> float:
         if self.total_processed == 0:
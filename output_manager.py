@@ -4,15 +4,25 @@ Per class diagram: OutputManager contains JobSourceResult (0..*) and ExecutionSt
 Per SRS FR-4.1 through FR-4.3.
 """
 
-import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import BinaryIO, Dict, Optional
+
+import orjson
 
 from config import Configuration
 from logger import Logger
 from models import ExecutionStatistics, JobSourceResult
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+
+def _indent(data: bytes, spaces: int) -> bytes:
+    """Indent every line of a JSON fragment so it nests in the streamed file."""
+    pad = b" " * spaces
+    return pad + data.replace(b"\n", b"\n" + pad)
+
 
 class OutputManager:
     """Manages result collection and JSON file output.
@@ -36,31 +46,56 @@ class OutputManager:
     ) -> None:
         self.output_dir: str = config.output_dir
         self.filename_template: str = "job_sources_{date}.json"
-        self.results: List[JobSourceResult] = []
+        self.result_count: int = 0
         self.statistics: ExecutionStatistics = statistics
         self._logger = logger
+        self._lock = threading.Lock()
+        self._stream: Optional[BinaryIO] = None
+        self._stream_path: str = ""
         self._ensure_output_dir()
 
     def add_result(self, result: JobSourceResult) -> None:
-        """Add a successful result to the collection."""
-        self.results.append(result)
+        """Append a successful result to the output file (safe across worker threads).
+
+        Results are written as they arrive instead of being buffered, so memory
+        stays flat and completed results are on disk even if the run crashes.
+        """
+        entry = _indent(orjson.dumps(result.to_dict(), option=_JSON_OPTIONS), 4)
+        with self._lock:
+            stream = self._open_stream()
+            stream.write(b",\n" if self.result_count else b"\n")
+            stream.write(entry)
+            stream.flush()
+            self.result_count += 1
 
     def save_to_json(self, filename: str = "") -> str:
-        """FR-4.1/FR-4.2: Save results + statistics to JSON file.
+        """FR-4.1/FR-4.2: Finish the JSON file with statistics and close it.
 
         Per sequence diagram: generate_filename -> _format_output -> save.
         Returns the filepath of the saved file.
         """
-        if not filename:
-            filename = self.generate_filename()
-
-        filepath = os.path.join(self.output_dir, filename)
-        output = self._format_output()
-
-        with open(filepath, "w") as f:
-            json.dump(output, f, indent=2, default=str)
-
-        self._logger.info(f"Saved {len(self.results)} results to {filepath}")
+        with self._lock:
+            stream = self._open_stream(filename)
+            stream.write(b"\n  ]," if self.result_count else b"],")
+            trailer = self._format_output()
+            for i, (key, value) in enumerate(trailer.items()):
+                separator = b"," if i < len(trailer) - 1 else b""
+                stream.write(
+                    b"\n  " + orjson.dumps(key) + b": "
+                    + _indent(orjson.dumps(value, option=_JSON_OPTIONS), 2).lstrip()
+                    + separator
+                )
+            stream.write(b"\n}\n")
+            stream.close()
+            self._stream = None
+            filepath = self._stream_path
+
+            if filename and os.path.basename(filepath) != filename:
+                target = os.path.join(self.output_dir, filename)
+                os.replace(filepath, target)
+                filepath = target
+
+        self._logger.info(f"Saved {self.result_count} results to {filepath}")
         return filepath
 
     def generate_filename(self) -> str:
@@ -68,10 +103,19 @@ class OutputManager:
         date_str = datetime.now().strftime("%Y-%m-%d")
         return self.filename_template.format(date=date_str)
 
+    def _open_stream(self, filename: str = "") -> BinaryIO:
+        """Open the output file and write the array header on first use."""
+        if self._stream is None:
+            self._stream_path = os.path.join(
+                self.output_dir, filename or self.generate_filename()
+            )
+            self._stream = open(self._stream_path, "wb")
+            self._stream.write(b'{\n  "results": [')
+        return self._stream
+
     def _format_output(self) -> Dict:
-        """Structure output with results array and statistics (FR-4.1 + FR-4.2)."""
+        """Fields written after the results array (FR-4.2)."""
         return {
-            "results": [r.to_dict() for r in self.results],
             "statistics": self.statistics.to_dict(),
             "generated_at": datetime.now().isoformat(),
         }
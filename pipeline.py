@@ -6,15 +6,22 @@ Per component diagram (Diagram 5): main entry point.
 
 Input: LinkedIn URL, max_companies
 Output: JSON file + console stats
-Dependencies: All modules + json
+Dependencies: All modules + asyncio (uvloop when installed)
 """
 
 import argparse
+import asyncio
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
-from career_finder import CareerPageFinder
+from career_finder_async import AsyncCareerPageFinder
 from claude_fallback import ClaudeFallback
 from config import Configuration
 from linkedin_fetcher import LinkedInFetcher
@@ -23,6 +30,22 @@ from models import CompanyData, ExecutionStatistics, JobSourceResult
 from output_manager import OutputManager
 from position_extractor import PositionExtractor
 
+T = TypeVar("T")
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run, on uvloop when it is installed (Linux/macOS)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    # Pre-3.11 has no loop_factory; the policy API is not deprecated there
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
 
 class JobSourcePipeline:
     """Main pipeline orchestrator — facade over all subsystems.
@@ -49,28 +72,31 @@ class JobSourcePipeline:
     """
 
     def __init__(self) -> None:
-        # All attributes initialized in _initialize_components
-        self.config: Optional[Configuration] = None
+        # Infrastructure first (temporal constraints 1 & 2): needed to validate inputs
+        self.config: Configuration = Configuration()
+        self.logger: Logger = Logger(log_file="output/pipeline.log")
+        self.statistics: ExecutionStatistics = ExecutionStatistics()
+        # Core components are built in run(), once inputs have been validated
         self.linkedin_fetcher: Optional[LinkedInFetcher] = None
-        self.career_finder: Optional[CareerPageFinder] = None
+        self.career_finder: Optional[AsyncCareerPageFinder] = None
         self.claude_fallback: Optional[ClaudeFallback] = None
         self.position_extractor: Optional[PositionExtractor] = None
         self.output_manager: Optional[OutputManager] = None
-        self.statistics: Optional[ExecutionStatistics] = None
-        self.logger: Optional[Logger] = None
-        self._initialize_components()
+        self._progress_lock = threading.Lock()
+        self._completed: int = 0
 
     def run(self, linkedin_url: str, max_companies: int = 50) -> None:
         """Main entry point — full pipeline execution.
 
         Per sequence diagram (Diagram 3):
-          1. Validate inputs
+          1. Validate inputs, then create the core components
           2. Record start time
           3. Fetch LinkedIn listings
           4. Extract company data
-          5. Loop: process each company
-          6. Save results to JSON
-          7. Print summary
+          5. Discover career pages for all companies concurrently
+          6. Extract a position for each company (parallel workers)
+          7. Save results to JSON
+          8. Print summary
 
         Args:
             linkedin_url: LinkedIn job search URL (single URL per run).
@@ -78,38 +104,58 @@ class JobSourcePipeline:
         """
         if not self._validate_inputs(linkedin_url, max_companies):
             return
+        self._initialize_components()
 
         self.logger.info("Starting pipeline")
-        self.statistics.start_time = datetime.now()
-
-        # Step 1: LinkedIn Data Acquisition (per sequence diagram)
-        raw_listings = self.linkedin_fetcher.fetch_job_listings(linkedin_url, limit=max_companies)
-        if not raw_listings:
-            self.logger.error("No listings fetched from LinkedIn, aborting")
-            return
-
-        companies = self.linkedin_fetcher.extract_company_data(raw_listings)
+        self.statistics.start_time = datetime.now()  # display only
+        run_start_ns = time.monotonic_ns()
+
+        # Step 1: LinkedIn Data Acquisition (per sequence diagram).
+        # Listings are streamed; extraction stops once FR-1.3 bounds are met.
+        # Closing the stream (even when islice stops early) logs the API cost now.
+        with closing(
+            self.linkedin_fetcher.fetch_job_listings(linkedin_url, limit=max_companies)
+        ) as raw_listings:
+            companies = list(
+                islice(self.linkedin_fetcher.extract_company_data(raw_listings), max_companies)
+            )
         if not companies:
             self.logger.error("No valid companies extracted, aborting")
             return
 
-        # Enforce FR-1.3 bounds
-        companies = companies[:max_companies]
         total = len(companies)
         self.logger.info(f"Processing {total} companies")
 
-        # Step 2: Process each company (per sequence diagram loop)
-        for i, company in enumerate(companies, 1):
-            self._print_progress(i, total)
-            result = self.process_single_company(company)
-            if result:
-                self.output_manager.add_result(result)
-
-        # Step 3: Finalize (per sequence diagram)
+        # Step 2: Career page discovery for all companies on one event loop
+        discovered = self.discover_career_pages(companies)
+
+        # Step 3: Process companies in parallel (per sequence diagram loop).
+        # Each worker drains a shared queue and owns its own browser.
+        work: "queue.Queue[CompanyData]" = queue.Queue()
+        for company in companies:
+            work.put(company)
+        self._completed = 0
+        processing_done = threading.Event()
+        reporter = threading.Thread(
+            target=self._report_progress, args=(total, processing_done), daemon=True
+        )
+        reporter.start()
+        workers = max(1, min(self.config.max_workers, total))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._process_worker, work, discovered)
+                    for _ in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            processing_done.set()
+            reporter.join()
+
+        # Step 4: Finalize (per sequence diagram)
         self.statistics.end_time = datetime.now()
-        self.statistics.total_processing_time = (
-            self.statistics.end_time - self.statistics.start_time
-        ).total_seconds()
+        self.statistics.total_processing_time = (time.monotonic_ns() - run_start_ns) / 1e9
 
         # Save output (FR-4.1, FR-4.2, FR-4.3)
         filepath = self.output_manager.save_to_json()
@@ -121,30 +167,37 @@ class JobSourcePipeline:
         print(f"Output: {filepath}")
         print(f"{'='*60}")
 
-        # Cleanup browser resources
-        self.position_extractor.close()
-
         # Persist logs
         self.logger.save_logs()
 
-    def process_single_company(self, company: CompanyData) -> Optional[JobSourceResult]:
-        """Process one company through career discovery + position extraction.
+    def discover_career_pages(
+        self, companies: List[CompanyData]
+    ) -> Dict[str, Tuple[Optional[str], int]]:
+        """Run 3-tier career page discovery for every company concurrently.
+
+        Returns a mapping of company_url -> (career page URL or None, tier).
+        """
+        company_urls = [company.company_url for company in companies]
+        discovered = _run_async(self.career_finder.find_career_pages(company_urls))
+        return dict(zip(company_urls, discovered))
+
+    def process_single_company(
+        self, company: CompanyData, career_url: Optional[str], source_tier: int = 0
+    ) -> Optional[JobSourceResult]:
+        """Process one company through position extraction.
 
         Per sequence diagram inner loop:
-          1. find_career_page(company_url)
+          1. career_url from discover_career_pages (3-tier strategy)
           2. If found: extract_first_position(career_url)
           3. If position found: create JobSourceResult
           4. On failure: increment_failure, log
 
         NFR-3.2: Continue execution on individual company failures.
         """
-        start = time.time()
+        start_ns = time.monotonic_ns()
         self.logger.info(f"Processing: {company.company_name} ({company.company_url})")
 
         try:
-            # Career page discovery (3-tier strategy)
-            career_url = self.career_finder.find_career_page(company.company_url)
-
             if not career_url:
                 self.statistics.increment_failure()
                 self.logger.warning(f"No career page found for {company.company_name}")
@@ -159,13 +212,13 @@ class JobSourcePipeline:
                 return None
 
             # Build result (FR-4.1 schema)
-            processing_time = time.time() - start
+            processing_time = (time.monotonic_ns() - start_ns) / 1e9
             result = JobSourceResult(
                 company_name=company.company_name,
                 career_page_url=career_url,
                 open_position_url=position_url,
                 timestamp=datetime.now(),
-                source_tier=self._determine_tier(),
+                source_tier=source_tier,
                 processing_time=processing_time,
             )
 
@@ -176,6 +229,30 @@ class JobSourcePipeline:
             self.handle_error(e, company)
             return None
 
+    def _process_worker(
+        self,
+        work: "queue.Queue[CompanyData]",
+        discovered: Dict[str, Tuple[Optional[str], int]],
+    ) -> None:
+        """Worker thread: process queued companies until the queue is empty."""
+        try:
+            while True:
+                try:
+                    company = work.get_nowait()
+                except queue.Empty:
+                    return
+                career_url, tier = discovered.get(company.company_url, (None, 0))
+                result = self.process_single_company(company, career_url, tier)
+                if result:
+                    self.output_manager.add_result(result)
+                with self._progress_lock:
+                    self._completed += 1
+        finally:
+            # Playwright objects are thread-bound: close this worker's browser here,
+            # skipping workers whose companies were all served without one
+            if self.position_extractor.was_used:
+                self.position_extractor.close()
+
     def handle_error(self, error: Exception, company: CompanyData) -> None:
         """NFR-3.2: Log error, continue to next company."""
         self.statistics.increment_failure()
@@ -185,18 +262,16 @@ class JobSourcePipeline:
         )
 
     def _initialize_components(self) -> None:
-        """Create all owned components (composition relationships).
+        """Create the core owned components (composition relationships).
 
         Per relationship constraints:
           1. Configuration must be initialized before any component.
           2. Logger must be available before any logging occurs.
           3. Statistics shared across components.
+        All three are created in __init__; this runs only after
+        _validate_inputs passes, so bad input never pays for client setup
+        or opens the results file (the log only records the validation error).
         """
-        # Infrastructure first (temporal constraint 1 & 2)
-        self.config = Configuration()
-        self.logger = Logger(log_file="output/pipeline.log")
-        self.statistics = ExecutionStatistics()
-
         # Core components (all receive config, logger, statistics)
         self.claude_fallback = ClaudeFallback(
             config=self.config,
@@ -208,7 +283,7 @@ class JobSourcePipeline:
             logger=self.logger,
             statistics=self.statistics,
         )
-        self.career_finder = CareerPageFinder(
+        self.career_finder = AsyncCareerPageFinder(
             config=self.config,
             logger=self.logger,
             statistics=self.statistics,
@@ -240,22 +315,25 @@ class JobSourcePipeline:
             return False
         return True
 
+    def _report_progress(self, total: int, done: threading.Event, interval: float = 0.25) -> None:
+        """Background thread: redraw progress every interval until done is set.
+
+        Workers only bump the shared counter, so terminal writes never sit on
+        the per-company path and bursts of completions coalesce into one update.
+        """
+        while not done.wait(interval):
+            with self._progress_lock:
+                current = self._completed
+            self._print_progress(current, total)
+        with self._progress_lock:
+            current = self._completed
+        self._print_progress(current, total)
+
     def _print_progress(self, current: int, total: int) -> None:
         """Display processing progress."""
         percent = (current / total) * 100
-        print(f"  [{current}/{total}] ({percent:.0f}%)", end="\r")
-
-    def _determine_tier(self) -> int:
-        """Determine which tier succeeded based on latest statistics delta."""
-        # The career_finder already incremented the correct tier in statistics;
-        # infer from the most recently incremented counter.
-        stats = self.statistics
-        tier_counts = [
-            (1, stats.tier1_success),
-            (2, stats.tier2_success),
-            (3, stats.tier3_success),
-        ]
-        return max(tier_counts, key=lambda x: x[1])[0]
+        sys.stdout.write(f"  [{current}/{total}] ({percent:.0f}%)\r")
+        sys.stdout.flush()
 
 
 # ─── CLI entry point (SRS Section 13) ───────────────────────────────────────
@@ -2,18 +2,32 @@
 
 Per class diagram: PositionExtractor with Playwright browser automation.
 Per SRS FR-3.1 through FR-3.4.
-Dependencies: playwright.
+Dependencies: playwright, requests, selectolax.
 API Budget: $0.
 """
 
-from typing import List, Optional
-from urllib.parse import urljoin
+import os
+import re
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
 
-from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+import diskcache
+import requests
+from playwright.sync_api import Browser, BrowserContext, Page, Route, sync_playwright
+from selectolax.lexbor import LexborHTMLParser
 
 from config import Configuration
 from logger import Logger
-from url_validator import URLValidator
+from url_validator import URLValidator, url_cache_key
+
+# Hrefs that never point at a job posting (mirrored by the in-page script)
+_BAD_HREF_PREFIX = re.compile(r"^(javascript:|mailto:|#)")
+
+
+def _page_identity(url: str) -> str:
+    """URL without fragment or trailing slash; the query is kept (e.g. ?gh_jid=)."""
+    return urldefrag(url)[0].rstrip("/")
 
 
 class PositionExtractor:
@@ -25,6 +39,11 @@ class PositionExtractor:
       - Uses Playwright Browser interface (component diagram)
 
     Per SRS FR-3.1: Handle JavaScript rendering via Playwright.
+
+    Playwright's sync objects are bound to the thread that created them, so
+    the playwright driver, browser and context are kept per thread. Each
+    worker thread launches its own browser on first use and must call
+    close() from that same thread.
     """
 
     # Common selectors for job listing links
@@ -46,38 +65,182 @@ class PositionExtractor:
         'a[class*="job"]',
     ]
 
+    # Too broad to trust in raw HTML: on JS-rendered career pages they match the
+    # site's own nav/section links, so a hit here waits for the rendered page
+    # (and _wait_for_content does not treat them as "listings have loaded")
+    STATIC_UNTRUSTED_SELECTORS: FrozenSet[str] = frozenset({
+        'a[href*="career"]',
+        '[class*="job"] a',
+        '[class*="position"] a',
+        '[class*="career"] a',
+    })
+
+    # Resources never needed to find a job link; aborted before download
+    BLOCKED_RESOURCE_TYPES: FrozenSet[str] = frozenset({"image", "media", "font", "stylesheet"})
+    BLOCKED_DOMAINS: Tuple[str, ...] = (
+        "doubleclick.net",
+        "googletagmanager.com",
+        "google-analytics.com",
+        "facebook.net",
+        "hotjar.com",
+        "segment.io",
+    )
+
+    # Chromium flags that trim per-browser memory and background work
+    BROWSER_ARGS: Tuple[str, ...] = (
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+    )
+
+    # In-page: walk selectors in priority order, collecting up to `limit`
+    # distinct usable hrefs (Set-based dedupe). For the usual limit of 1,
+    # querySelector stops at the first match and the full NodeList is only
+    # materialized when that match has an unusable href.
+    _FIND_JOB_HREFS_JS: str = """
+        ({selectors, limit}) => {
+            const badPrefix = /^(javascript:|mailto:|#)/;
+            const usable = (el) => {
+                const href = el.getAttribute("href");
+                return href && !badPrefix.test(href) ? href : null;
+            };
+            const seen = new Set();
+            const found = [];
+            for (const selector of selectors) {
+                let first;
+                try {
+                    first = document.querySelector(selector);
+                } catch (e) {
+                    continue;  // skip selectors the page's engine rejects
+                }
+                if (!first) continue;
+                const candidates = limit === 1 && usable(first)
+                    ? [first] : document.querySelectorAll(selector);
+                for (const el of candidates) {
+                    const href = usable(el);
+                    if (href && !seen.has(href)) {
+                        seen.add(href);
+                        found.push(href);
+                        if (found.length >= limit) return found;
+                    }
+                }
+            }
+            return found;
+        }
+    """
+
     def __init__(self, config: Configuration, logger: Logger) -> None:
         self.browser_timeout: int = config.browser_timeout  # FR-3.4: 15000ms
         self.page_load_timeout: int = config.browser_timeout
         self.job_selectors: List[str] = list(self.JOB_SELECTORS)
+        self.candidate_links: int = 5  # hrefs read per rendered page
         self.headless: bool = True
-        self.browser_context: Optional[BrowserContext] = None
         self._config = config
         self._logger = logger
-        self._validator = URLValidator(timeout=config.request_timeout)
-        self._browser: Optional[Browser] = None
-        self._playwright = None
+        self._validator = URLValidator(
+            timeout=config.request_timeout,
+            cache_dir=config.cache_dir,
+            ttl_seconds=config.url_cache_ttl,
+        )
+        self._local = threading.local()
+        # Results keyed by normalized career URL: in-process, then on disk
+        self.cache_ttl: int = config.position_cache_ttl
+        self._memo: Dict[str, str] = {}
+        self._position_cache = diskcache.Cache(os.path.join(config.cache_dir, "positions"))
+        # Plain HTTP session for the static (no-browser) fast path
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = self._validator.user_agent
+
+    @property
+    def browser_context(self) -> Optional[BrowserContext]:
+        return getattr(self._local, "browser_context", None)
+
+    @browser_context.setter
+    def browser_context(self, value: Optional[BrowserContext]) -> None:
+        self._local.browser_context = value
+
+    @property
+    def _browser(self) -> Optional[Browser]:
+        return getattr(self._local, "browser", None)
+
+    @_browser.setter
+    def _browser(self, value: Optional[Browser]) -> None:
+        self._local.browser = value
 
-    def extract_first_position(self, career_page_url: str) -> Optional[str]:
+    @property
+    def _playwright(self):
+        return getattr(self._local, "playwright", None)
+
+    @_playwright.setter
+    def _playwright(self, value) -> None:
+        self._local.playwright = value
+
+    @property
+    def was_used(self) -> bool:
+        """True once this thread has started Playwright (i.e. close() has work to do)."""
+        return self._playwright is not None
+
+    @property
+    def _page_pool(self) -> List[Page]:
+        """Idle pages of this thread's context, reused across companies."""
+        if not hasattr(self._local, "page_pool"):
+            self._local.page_pool = []
+        return self._local.page_pool
+
+    def extract_first_position(
+        self, career_page_url: str, force_refresh: bool = False
+    ) -> Optional[str]:
         """FR-3.2: Extract first available job posting URL.
 
         Per sequence diagram: navigate_to_page -> find_job_links -> return first.
         FR-3.3: Return absolute URL only.
         FR-3.4: Timeout after 15 seconds.
+
+        Found positions are cached per career URL (in memory and on disk for
+        cache_ttl); force_refresh bypasses the cache and re-extracts. The key
+        keeps the query string, since shared job boards tell companies apart
+        by it (e.g. .../embed/job_board?for=acme).
         """
+        key = url_cache_key(career_page_url)
+        if not force_refresh:
+            cached = self._memo.get(key) or self._position_cache.get(key)
+            if cached:
+                self._memo[key] = cached
+                self._logger.info(f"Found position (cached): {cached}")
+                return cached
+
+        result = self._extract_uncached(career_page_url)
+        if result:
+            self._memo[key] = result
+            self._position_cache.set(key, result, expire=self.cache_ttl)
+        return result
+
+    def _extract_uncached(self, career_page_url: str) -> Optional[str]:
+        """Static fetch first, then Playwright (see extract_first_position)."""
         self._logger.info(f"Extracting position from {career_page_url}")
         try:
+            # Server-rendered pages: plain GET + parse, no browser needed
+            static_url = self._try_static_extract(career_page_url)
+            if static_url:
+                self._logger.info(f"Found position (static): {static_url}")
+                return static_url
+
             page = self.navigate_to_page(career_page_url)
             if page is None:
                 return None
 
-            job_links = self.find_job_links(page)
-            page.close()
+            # A few candidates, so a nav link back to this page can be skipped
+            job_links = self.find_job_links(page, limit=self.candidate_links)
+            final_url = page.url
+            self._release_page(page)
 
-            if job_links:
-                absolute_url = self.make_absolute_url(career_page_url, job_links[0])
-                self._logger.info(f"Found position: {absolute_url}")
-                return absolute_url
+            own_pages = {_page_identity(career_page_url), _page_identity(final_url)}
+            for href in job_links:
+                absolute_url = self.make_absolute_url(final_url, href)
+                if _page_identity(absolute_url) not in own_pages:
+                    self._logger.info(f"Found position: {absolute_url}")
+                    return absolute_url
 
             self._logger.warning(f"No job links found on {career_page_url}")
             return None
@@ -96,62 +259,150 @@ class PositionExtractor:
                 self.browser_context = self._browser.new_context(
                     user_agent=self._validator.user_agent
                 )
+                self.browser_context.route("**/*", self._block_heavy_resources)
 
-            page = self.browser_context.new_page()
+            page = self._acquire_page()
+        except Exception as e:
+            self._logger.error(f"Navigation failed for {url}", e)
+            return None
+
+        try:
             page.goto(url, timeout=self.page_load_timeout, wait_until="domcontentloaded")
             self._wait_for_content(page)
             return page
 
         except Exception as e:
+            self._release_page(page)
             self._logger.error(f"Navigation failed for {url}", e)
             return None
 
-    def find_job_links(self, page: Page) -> List[str]:
-        """Find job posting links on the page using selectors."""
-        found_urls: List[str] = []
+    def find_job_links(self, page: Page, limit: int = 1) -> List[str]:
+        """Find job posting links on the page using selectors.
+
+        All selectors are evaluated in-page in a single round-trip; selector
+        priority order is preserved. Returns up to `limit` distinct hrefs
+        (FR-3.2: the default of 1 is the first available posting).
+        """
+        try:
+            return page.evaluate(
+                self._FIND_JOB_HREFS_JS, {"selectors": self.job_selectors, "limit": limit}
+            )
+        except Exception:
+            return []
+
+    def make_absolute_url(self, base_url: str, job_url: str) -> str:
+        """FR-3.3: Return absolute URL only.
 
+        Already-absolute hrefs (the common case) skip the urljoin merge.
+        """
+        if job_url.startswith(("http://", "https://")):
+            return job_url
+        return urljoin(base_url, job_url)
+
+    def _try_static_extract(self, url: str) -> Optional[str]:
+        """Find a job link in the raw HTML, before paying for a browser page.
+
+        Returns the absolute posting URL, resolved against the final
+        (post-redirect) URL. Returns None (fall back to Playwright) on any
+        error or no match, e.g. for pages that only render their listings
+        with JavaScript. Only specific selectors are trusted here, and links
+        back to the career page itself are ignored.
+        """
+        try:
+            response = self._session.get(
+                url, timeout=self._validator.timeout, allow_redirects=True
+            )
+            if response.status_code != 200:
+                return None
+            tree = LexborHTMLParser(response.content)
+        except Exception:
+            return None
+
+        own_pages = {_page_identity(url), _page_identity(response.url)}
         for selector in self.job_selectors:
+            if selector in self.STATIC_UNTRUSTED_SELECTORS:
+                continue
             try:
-                elements = page.query_selector_all(selector)
-                for element in elements:
-                    url = self._extract_job_url(element)
-                    if url and url not in found_urls:
-                        found_urls.append(url)
-                        if len(found_urls) >= 1:  # FR-3.2: first available
-                            return found_urls
+                nodes = tree.css(selector)
             except Exception:
                 continue
+            for node in nodes:
+                href = node.attributes.get("href")
+                if not self._is_usable_href(href):
+                    continue
+                absolute_url = self.make_absolute_url(response.url, href)
+                if _page_identity(absolute_url) not in own_pages:
+                    return absolute_url
+        return None
 
-        return found_urls
-
-    def make_absolute_url(self, base_url: str, job_url: str) -> str:
-        """FR-3.3: Return absolute URL only."""
-        return urljoin(base_url, job_url)
+    def _is_usable_href(self, href: Optional[str]) -> bool:
+        """Reject empty, javascript:, mailto: and fragment-only links."""
+        return bool(href) and not _BAD_HREF_PREFIX.match(href)
 
     def _initialize_browser(self) -> Browser:
         """Launch Playwright Chromium browser (component diagram: Playwright Browser)."""
         self._playwright = sync_playwright().start()
-        return self._playwright.chromium.launch(headless=self.headless)
+        args = list(self.BROWSER_ARGS)
+        sandboxed = not self._config.browser_no_sandbox
+        if not sandboxed:
+            # The sandbox needs the zygote; it can only be skipped without one
+            args.append("--no-zygote")
+        # Playwright itself adds --no-sandbox unless chromium_sandbox is True
+        return self._playwright.chromium.launch(
+            headless=self.headless, args=args, chromium_sandbox=sandboxed
+        )
+
+    def _block_heavy_resources(self, route: Route) -> None:
+        """Abort images/media/fonts/stylesheets and known trackers; pass the rest."""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+            return
+        host = urlparse(request.url).netloc
+        if any(host == domain or host.endswith("." + domain) for domain in self.BLOCKED_DOMAINS):
+            route.abort()
+            return
+        route.continue_()
+
+    def _acquire_page(self) -> Page:
+        """Take an idle page from this thread's pool, or open a new one."""
+        if self._page_pool:
+            return self._page_pool.pop()
+        return self.browser_context.new_page()
+
+    def _release_page(self, page: Page) -> None:
+        """Return a page to the pool instead of closing it (next goto replaces it)."""
+        if page.is_closed():
+            return
+        self._page_pool.append(page)
 
     def _wait_for_content(self, page: Page) -> None:
-        """Wait for dynamic content to load."""
-        try:
-            page.wait_for_load_state("networkidle", timeout=5000)
-        except Exception:
-            pass  # Best-effort; page may already have content
+        """Wait for dynamic content to load.
 
-    def _extract_job_url(self, element: object) -> Optional[str]:
-        """Extract href from a link element."""
+        Returns as soon as a specific job selector is present; otherwise pays
+        for the (up to 5s) networkidle wait. The broad selectors in
+        STATIC_UNTRUSTED_SELECTORS are not waited on, since the site's own
+        nav matches them before any listings have rendered.
+        """
+        trusted = [s for s in self.job_selectors if s not in self.STATIC_UNTRUSTED_SELECTORS]
         try:
-            href = element.get_attribute("href")
-            if href and not href.startswith(("javascript:", "mailto:", "#")):
-                return href
+            page.wait_for_selector(", ".join(trusted), timeout=2000)
+            return
         except Exception:
             pass
-        return None
+        try:
+            page.wait_for_load_state("networkidle", timeout=5000)
+        except Exception:
+            pass  # Best-effort; page may already have content
 
     def close(self) -> None:
-        """Cleanup browser resources."""
+        """Cleanup the calling thread's browser resources.
+
+        No-op when this thread never launched a browser.
+        """
+        if not self.was_used:
+            return
+        self._page_pool.clear()  # pages are closed with their context
         if self.browser_context:
             self.browser_context.close()
             self.browser_context = None
@@ -4,9 +4,73 @@ Per class diagram: used by CareerPageFinder and PositionExtractor via dependency
 Per SRS NFR-3.3: Validate URLs before returning (200 status check).
 """
 
-from urllib.parse import urljoin, urlparse
+import asyncio
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import ParseResult, urljoin, urlparse
 
+import aiohttp
+import diskcache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Memoized URL helpers: nav/footer hrefs and base URLs repeat heavily across
+# pages, so caching on the raw strings skips redundant parsing.
+@lru_cache(maxsize=4096)
+def cached_urlparse(url: str) -> ParseResult:
+    """urlparse with per-string memoization (ParseResult is immutable)."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def cached_urljoin(base: str, relative: str) -> str:
+    """urljoin with per-(base, relative) memoization."""
+    return urljoin(base, relative)
+
+
+def has_scheme_and_host(url: str) -> bool:
+    """Structural check: URL has a scheme and a network location.
+
+    http(s) URLs (nearly all inputs) are checked by prefix without parsing;
+    anything else falls back to urlparse.
+    """
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        try:
+            parsed = cached_urlparse(url)
+        except ValueError:
+            return False
+        return bool(parsed.scheme and parsed.netloc)
+    return bool(rest) and rest[0] not in "/?#"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    url = url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+    parsed = cached_urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
+
+
+@lru_cache(maxsize=4096)
+def url_cache_key(url: str) -> str:
+    """Cache key for per-URL results: scheme/host lowercased, fragment dropped, query kept.
+
+    Unlike _normalize_url the query stays, since it often identifies the
+    resource (e.g. ...?gh_jid=1 vs ...?gh_jid=2 are different postings,
+    ...job_board?for=acme vs ?for=globex are different companies' boards).
+    """
+    parsed = cached_urlparse(url.strip())
+    path = parsed.path.rstrip("/")
+    query = f"?{parsed.query}" if parsed.query else ""
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}{query}"
 
 
 class URLValidator:
@@ -14,48 +78,133 @@ class URLValidator:
 
     Per class diagram: timeout, user_agent attributes.
     Dependencies: CareerPageFinder ..> URLValidator, PositionExtractor ..> URLValidator.
+
+    When cache_dir is given, HTTP status checks are persisted per URL
+    (query included) for ttl_seconds so repeat runs skip the round-trip.
     """
 
-    def __init__(self, timeout: int = 5) -> None:
+    def __init__(
+        self,
+        timeout: int = 5,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: int = 24 * 3600,
+    ) -> None:
         self.timeout: int = timeout
+        self.ttl_seconds: int = ttl_seconds
         self.user_agent: str = (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36"
         )
+        self._status_cache: Optional[diskcache.Cache] = (
+            diskcache.Cache(os.path.join(cache_dir, "urls")) if cache_dir else None
+        )
+        # Keep-alive session: repeat checks against a host reuse TCP/TLS
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = self.user_agent
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=1, backoff_factor=0.1),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self.max_concurrent_checks: int = 16
 
     def is_valid(self, url: str) -> bool:
         """Check that URL is well-formed and returns HTTP 200. Per NFR-3.3."""
         try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
+            if not has_scheme_and_host(url):
                 return False
             status = self._check_status(url)
             return status == 200
         except Exception:
             return False
 
+    def validate_many(self, urls: List[str]) -> Dict[str, bool]:
+        """Batch is_valid: HEAD all URLs concurrently (max_concurrent_checks at once).
+
+        Latency is roughly the slowest single check rather than the sum.
+        Must not be called from inside a running event loop.
+        """
+        candidates = [url for url in urls if has_scheme_and_host(url)]
+        statuses = dict(asyncio.run(self._check_many(candidates))) if candidates else {}
+        return {url: statuses.get(url) == 200 for url in urls}
+
     def normalize(self, url: str) -> str:
         """Ensure URL has scheme and trailing slash normalization."""
-        url = url.strip()
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
+        return _normalize_url(url)
 
     def make_absolute(self, base: str, relative: str) -> str:
         """Convert relative URL to absolute. Per FR-2.5 and FR-3.3."""
-        return urljoin(base, relative)
+        if relative.startswith(("http://", "https://")):
+            return relative
+        return cached_urljoin(base, relative)
 
     def _check_status(self, url: str) -> int:
-        """HTTP HEAD request to check URL status. Per NFR-1.3: 5s timeout."""
+        """HTTP HEAD request to check URL status. Per NFR-1.3: 5s timeout.
+
+        Sites that reject HEAD (commonly 403/405 behind CDNs) get one
+        streamed GET retry; its body is never downloaded.
+        Served from the status cache when a fresh entry exists; network
+        failures (status 0) are not cached so they are retried next time.
+        """
+        key = url_cache_key(url)
+        if self._status_cache is not None:
+            cached = self._status_cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            response = requests.head(
-                url,
-                timeout=self.timeout,
-                headers={"User-Agent": self.user_agent},
-                allow_redirects=True,
-            )
-            return response.status_code
+            response = self._session.head(url, timeout=self.timeout, allow_redirects=True)
+            status = response.status_code
+            if status >= 400:
+                with self._session.get(
+                    url, timeout=self.timeout, allow_redirects=True, stream=True
+                ) as response:
+                    status = response.status_code
         except requests.RequestException:
             return 0
+
+        if self._status_cache is not None:
+            self._status_cache.set(key, status, expire=self.ttl_seconds)
+        return status
+
+    async def _check_many(self, urls: List[str]) -> List[Tuple[str, int]]:
+        """Concurrent HEAD checks over one aiohttp session, cache-first.
+
+        Mirrors _check_status: a HEAD status >= 400 is retried once with GET.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(
+            headers={"User-Agent": self.user_agent}, timeout=timeout
+        ) as session:
+
+            async def check_one(url: str) -> Tuple[str, int]:
+                key = url_cache_key(url)
+                if self._status_cache is not None:
+                    cached = self._status_cache.get(key)
+                    if cached is not None:
+                        return url, cached
+                async with semaphore:
+                    try:
+                        async with session.head(url, allow_redirects=True) as response:
+                            status = response.status
+                        if status >= 400:
+                            async with session.get(url, allow_redirects=True) as response:
+                                status = response.status
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        return url, 0
+                if self._status_cache is not None:
+                    self._status_cache.set(key, status, expire=self.ttl_seconds)
+                return url, status
+
+            return await asyncio.gather(*(check_one(url) for url in urls))
+
+    def close(self) -> None:
+        """Release pooled connections and the status cache."""
+        self._session.close()
+        if self._status_cache is not None:
+            self._status_cache.close()